@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import os
+import sys
 
 from dotenv import load_dotenv
 from livekit.agents import (
@@ -16,8 +19,22 @@ from livekit.agents import (
 from livekit.plugins import noise_cancellation, silero
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
+try:
+    import uringcore
+except ImportError:
+    uringcore = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger("agent")
 
+# Records whether io_uring works ("1") or not ("0") so job processes, which
+# inherit the supervisor's environment, don't repeat the check
+_IO_URING_ENV = "AGENT_IO_URING"
+
 load_dotenv(".env.local")
 
 
@@ -49,6 +66,9 @@ class Assistant(Agent):
 
 
 def prewarm(proc: JobProcess):
+    # Jobs run in a child process that builds its own event loop after prewarm,
+    # so the policy has to be installed here as well as in the supervisor
+    set_event_loop_policy()
     proc.userdata["vad"] = silero.VAD.load()
 
 
@@ -128,5 +148,37 @@ async def entrypoint(ctx: JobContext):
     await ctx.connect()
 
 
+def _io_uring_works() -> bool:
+    # Older kernels and container seccomp profiles can reject the io_uring
+    # syscalls, so make sure a loop can actually be created before using it
+    try:
+        uringcore.EventLoopPolicy().new_event_loop().close()
+    except Exception:
+        logger.warning(
+            "io_uring event loop is unavailable, falling back", exc_info=True
+        )
+        return False
+    return True
+
+
+def set_event_loop_policy():
+    # An io_uring loop (Linux 5.11+, optional `uringcore` package) avoids most of the
+    # per-packet syscalls; otherwise uvloop's libuv-based loop still schedules
+    # callbacks faster than the stock asyncio loop
+    if sys.platform == "linux" and uringcore is not None:
+        io_uring = os.environ.get(_IO_URING_ENV)
+        if io_uring is None:
+            io_uring = "1" if _io_uring_works() else "0"
+            os.environ[_IO_URING_ENV] = io_uring
+
+        if io_uring == "1":
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return
+
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    set_event_loop_policy()
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
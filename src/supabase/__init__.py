@@ -4,6 +4,6 @@ This module provides a Supabase client for storing conversation data,
 user preferences, or any other persistent data your agent needs.
 """
 
-from .client import get_supabase_client, SupabaseClient
+from .client import SupabaseClient, get_supabase_client, reset_supabase_client
 
-__all__ = ["get_supabase_client", "SupabaseClient"]
+__all__ = ["SupabaseClient", "get_supabase_client", "reset_supabase_client"]
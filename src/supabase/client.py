@@ -1,6 +1,7 @@
 """Supabase client setup for data persistence."""
 
 import os
+import threading
 from typing import Optional
 
 try:
@@ -10,10 +11,16 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     SupabaseClient = None
 
+_client: Optional[SupabaseClient] = None
+_client_lock = threading.Lock()
+
 
 def get_supabase_client() -> Optional[SupabaseClient]:
     """Create and return a Supabase client if configured.
 
+    The client is created on the first call and shared by every later call
+    in the process, so callers don't pay for a new HTTP transport each time.
+
     Returns:
         Supabase client if environment variables are set, None otherwise.
 
@@ -37,9 +44,14 @@ def get_supabase_client() -> Optional[SupabaseClient]:
             }).execute()
         ```
     """
+    global _client
+
     if not SUPABASE_AVAILABLE:
         return None
 
+    if _client is not None:
+        return _client
+
     url = os.getenv("SUPABASE_URL")
     # Prefer service key for server-side operations, fall back to anon key
     key = os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_ANON_KEY")
@@ -47,4 +59,18 @@ def get_supabase_client() -> Optional[SupabaseClient]:
     if not url or not key:
         return None
 
-    return create_client(url, key)
+    with _client_lock:
+        if _client is None:
+            _client = create_client(url, key)
+    return _client
+
+
+def reset_supabase_client() -> None:
+    """Drop the shared Supabase client so the next call creates a new one.
+
+    Useful in tests, or after changing the Supabase environment variables.
+    """
+    global _client
+
+    with _client_lock:
+        _client = None
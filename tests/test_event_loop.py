@@ -0,0 +1,115 @@
+import asyncio
+import os
+import types
+
+import pytest
+
+import agent
+
+
+class _StubPolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _restore_event_loop_policy():
+    os.environ.pop(agent._IO_URING_ENV, None)
+    yield
+    asyncio.set_event_loop_policy(None)
+    os.environ.pop(agent._IO_URING_ENV, None)
+
+
+def test_uses_uvloop_when_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    """uvloop's policy is installed when uringcore is not available."""
+    monkeypatch.setattr(agent, "uringcore", None)
+    monkeypatch.setattr(
+        agent, "uvloop", types.SimpleNamespace(EventLoopPolicy=_StubPolicy)
+    )
+
+    agent.set_event_loop_policy()
+
+    assert isinstance(asyncio.get_event_loop_policy(), _StubPolicy)
+
+
+def test_keeps_default_loop_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The stock asyncio policy is left alone when neither loop is installed."""
+    monkeypatch.setattr(agent, "uringcore", None)
+    monkeypatch.setattr(agent, "uvloop", None)
+    before = asyncio.get_event_loop_policy()
+
+    agent.set_event_loop_policy()
+
+    assert asyncio.get_event_loop_policy() is before
+
+
+def test_prewarm_installs_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Job processes pick up the faster loop, since prewarm runs in the child."""
+    monkeypatch.setattr(agent, "uringcore", None)
+    monkeypatch.setattr(
+        agent, "uvloop", types.SimpleNamespace(EventLoopPolicy=_StubPolicy)
+    )
+    monkeypatch.setattr(agent.silero.VAD, "load", staticmethod(lambda: "vad"))
+    proc = types.SimpleNamespace(userdata={})
+
+    agent.prewarm(proc)
+
+    assert isinstance(asyncio.get_event_loop_policy(), _StubPolicy)
+    assert proc.userdata["vad"] == "vad"
+
+
+class _BrokenUringPolicy(asyncio.DefaultEventLoopPolicy):
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        raise OSError("io_uring_setup: Operation not permitted")
+
+
+def test_uses_uringcore_on_linux(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The io_uring policy is preferred on Linux when a loop can be created."""
+    monkeypatch.setattr(agent.sys, "platform", "linux")
+    monkeypatch.setattr(
+        agent, "uringcore", types.SimpleNamespace(EventLoopPolicy=_StubPolicy)
+    )
+    monkeypatch.setattr(agent, "uvloop", None)
+
+    agent.set_event_loop_policy()
+
+    assert isinstance(asyncio.get_event_loop_policy(), _StubPolicy)
+    assert os.environ[agent._IO_URING_ENV] == "1"
+
+
+def test_falls_back_to_uvloop_when_io_uring_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A kernel or seccomp profile that rejects io_uring falls back to uvloop."""
+    monkeypatch.setattr(agent.sys, "platform", "linux")
+    monkeypatch.setattr(
+        agent, "uringcore", types.SimpleNamespace(EventLoopPolicy=_BrokenUringPolicy)
+    )
+    monkeypatch.setattr(
+        agent, "uvloop", types.SimpleNamespace(EventLoopPolicy=_StubPolicy)
+    )
+
+    agent.set_event_loop_policy()
+
+    assert type(asyncio.get_event_loop_policy()) is _StubPolicy
+    assert os.environ[agent._IO_URING_ENV] == "0"
+
+
+def test_job_process_reuses_io_uring_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed check recorded by the supervisor is not repeated in job processes."""
+    monkeypatch.setattr(agent.sys, "platform", "linux")
+    monkeypatch.setattr(
+        agent, "uringcore", types.SimpleNamespace(EventLoopPolicy=_BrokenUringPolicy)
+    )
+    monkeypatch.setattr(
+        agent, "uvloop", types.SimpleNamespace(EventLoopPolicy=_StubPolicy)
+    )
+    monkeypatch.setenv(agent._IO_URING_ENV, "0")
+
+    def _fail() -> bool:
+        raise AssertionError("io_uring check should not run again")
+
+    monkeypatch.setattr(agent, "_io_uring_works", _fail)
+
+    agent.set_event_loop_policy()
+
+    assert type(asyncio.get_event_loop_policy()) is _StubPolicy
@@ -0,0 +1,67 @@
+import pytest
+
+from supabase import client as supabase_client
+from supabase import reset_supabase_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_client():
+    reset_supabase_client()
+    yield
+    reset_supabase_client()
+
+
+@pytest.fixture
+def created(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Stub out supabase-py and record every client it is asked to create."""
+    created = []
+
+    def _create_client(url: str, key: str) -> object:
+        client = object()
+        created.append((url, key, client))
+        return client
+
+    monkeypatch.setattr(supabase_client, "SUPABASE_AVAILABLE", True)
+    monkeypatch.setattr(supabase_client, "create_client", _create_client, raising=False)
+    for name in ("SUPABASE_URL", "SUPABASE_SERVICE_KEY", "SUPABASE_ANON_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    return created
+
+
+def test_reuses_client(monkeypatch: pytest.MonkeyPatch, created: list) -> None:
+    """Later calls return the client created by the first one."""
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_ANON_KEY", "anon")
+
+    first = supabase_client.get_supabase_client()
+
+    assert first is not None
+    assert supabase_client.get_supabase_client() is first
+    assert len(created) == 1
+
+
+def test_unconfigured_returns_none_without_caching(
+    monkeypatch: pytest.MonkeyPatch, created: list
+) -> None:
+    """Missing env vars return None, and a later configured call still connects."""
+    assert supabase_client.get_supabase_client() is None
+    assert created == []
+
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "service")
+
+    assert supabase_client.get_supabase_client() is not None
+    assert created[0][:2] == ("https://example.supabase.co", "service")
+
+
+def test_reset_rebuilds_client(monkeypatch: pytest.MonkeyPatch, created: list) -> None:
+    """Resetting drops the shared client so the next call creates a new one."""
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_ANON_KEY", "anon")
+
+    first = supabase_client.get_supabase_client()
+    reset_supabase_client()
+    second = supabase_client.get_supabase_client()
+
+    assert second is not first
+    assert len(created) == 2